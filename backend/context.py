@@ -1,7 +1,7 @@
 """
 Context construction for the AI Digital Twin.
 
-This module assembles a dynamically generated system prompt using the personal
+This module assembles the static system prompt using the personal
 resources loaded from `resources.py`. The resulting prompt is passed to the LLM
 to ensure the Digital Twin consistently represents Roger J. Campbell, using:
 
@@ -10,8 +10,9 @@ to ensure the Digital Twin consistently represents Roger J. Campbell, using:
 - style.txt         (communication style)
 - linkedin.pdf      (PDF-extracted text)
 
-The `prompt()` function returns a complete system prompt string containing all
-relevant persona data, communication rules, and guardrails. This prompt is
+The static prompt is assembled once at import. The `prompt()` function returns
+it (optionally followed by dynamic memory context), containing all relevant
+persona data, communication rules, and guardrails. This prompt is
 designed to ensure the Digital Twin behaves naturally, professionally, and
 faithfully in alignment with Roger’s real identity, with light use of Markdown
 for emphasis and readability.
@@ -22,7 +23,9 @@ for emphasis and readability.
 # ============================================================
 
 from resources import linkedin, summary, facts, style
-from datetime import datetime
+from string import Template
+from typing import Optional
+import orjson
 
 
 # ============================================================
@@ -34,13 +37,25 @@ full_name: str = facts["full_name"]
 name: str = facts["name"]
 
 
+# ============================================================
+# Normalised Persona Content
+# ============================================================
+
+# Canonical forms of the persona resources, so the system prompt is
+# byte-for-byte stable (a prerequisite for provider-side prompt caching)
+facts_json: str = orjson.dumps(facts, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+summary_text: str = summary.strip()
+linkedin_text: str = linkedin.strip()
+style_text: str = style.strip()
+
+
 # ============================================================
 # Prompt Generation
 # ============================================================
 
-def prompt() -> str:
+def _build_static_prompt() -> str:
     """
-    Construct and return the complete system prompt for the Digital Twin.
+    Construct the static system prompt for the Digital Twin.
 
     This prompt establishes:
     - The Digital Twin’s role
@@ -50,12 +65,16 @@ def prompt() -> str:
     - Extracted LinkedIn/CV content
     - Light Markdown usage guidelines
     - Guardrails for behaviour and safety
-    - The current date and time (for temporal grounding)
+
+    The prompt contains no per-request or time-dependent content, so it is
+    byte-for-byte identical across calls and can be served from the model
+    provider's prompt cache. Dynamic context (e.g. the current date) is
+    supplied separately by the caller.
 
     Returns
     -------
     str
-        A fully assembled system prompt string to be passed to the LLM.
+        The fully assembled static system prompt.
     """
     return f"""
 # Your Role
@@ -69,19 +88,16 @@ Digital Twin of {name} and you should present yourself as {name}.
 ## Important Context
 
 Here is some basic information about {name}:
-{facts}
+{facts_json}
 
 Here are summary notes from {name}:
-{summary}
+{summary_text}
 
 Here is the LinkedIn profile of {name}:
-{linkedin}
+{linkedin_text}
 
 Here are some notes from {name} about their communication style:
-{style}
-
-For reference, here is the current date and time:
-{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+{style_text}
 
 ## Formatting Guidelines
 
@@ -125,3 +141,39 @@ Please engage with the user.
 Avoid responding in a way that feels like a chatbot or generic AI assistant, and do not end every message with a question. 
 Aim for a natural, intelligent flow of conversation — a true reflection of {name}.
 """
+
+
+# Static prompt, assembled once at import
+_STATIC_PROMPT: str = _build_static_prompt()
+
+# Static prompt followed by a single dynamic `$memory` slot. Literal `$` in the
+# persona content is escaped so only the slot is substituted.
+_TEMPLATE: Template = Template(
+    _STATIC_PROMPT.replace("$", "$$")
+    + "\n## Relevant Memory\n\n$memory\n"
+)
+
+
+def prompt(memory: Optional[str] = None) -> str:
+    """
+    Return the system prompt for the Digital Twin.
+
+    The static part is built once at import, so the common case is a plain
+    lookup. When `memory` is given (e.g. retrieved context), it is substituted
+    into a single slot appended after the static part, keeping the static
+    prefix bit-identical for prompt caching.
+
+    Parameters
+    ----------
+    memory : Optional[str], optional
+        Dynamic context to append after the static prompt, by default None.
+
+    Returns
+    -------
+    str
+        A fully assembled system prompt string to be passed to the LLM.
+    """
+    if memory is None:
+        return _STATIC_PROMPT
+
+    return _TEMPLATE.substitute(memory=memory)
@@ -7,9 +7,11 @@ llmops-digital-twin backend. It performs the following steps:
 1. Cleans previous build artifacts
 2. Installs all Python dependencies inside a Docker container that matches the
    AWS Lambda Python 3.12 runtime
-3. Collects application files (`server.py`, `lambda_handler.py`, etc.)
+3. Collects application files (`server.py`, `run.sh`, etc.)
 4. Copies the `data/` directory used for contextual persona resources
-5. Builds a deployment ZIP (`lambda-deployment.zip`) suitable for uploading
+5. Pre-extracts `data/linkedin.pdf` to `data/linkedin.txt` so the Lambda never
+   parses the PDF (or ships a PDF library) at cold start
+6. Builds a deployment ZIP (`lambda-deployment.zip`) suitable for uploading
    to AWS Lambda or for use in a Lambda Layer
 
 Using Docker ensures full binary compatibility with Lambda's Linux environment.
@@ -25,6 +27,40 @@ import zipfile
 import subprocess
 
 
+# ============================================================
+# Build Helpers
+# ============================================================
+
+def extract_linkedin_text(pdf_path: str, txt_path: str) -> None:
+    """
+    Extract the LinkedIn/CV PDF to a plain-text file at build time.
+
+    Runs on the build machine (PyMuPDF is a development dependency only, see
+    `requirements-dev.txt`), so `resources.py` can read the text directly
+    inside Lambda.
+
+    Parameters
+    ----------
+    pdf_path : str
+        Path to the source PDF.
+    txt_path : str
+        Destination path for the extracted text.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        raise SystemExit(
+            "❌ PyMuPDF is required to extract linkedin.pdf. "
+            "Install it with `pip install -r requirements-dev.txt` (or `uv sync`)."
+        )
+
+    with pymupdf.open(pdf_path) as doc:
+        text = "".join(page.get_text() for page in doc)
+
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
 # ============================================================
 # Main Deployment Function
 # ============================================================
@@ -38,6 +74,7 @@ def main() -> None:
     - Build a clean `lambda-package/` directory
     - Install dependencies using the AWS Lambda Python 3.12 Docker image
     - Copy application source files and the `data/` folder
+    - Pre-extract the LinkedIn PDF to text inside the package
     - Package the result as `lambda-deployment.zip`
     """
     print("🚀 Creating Lambda deployment package...")
@@ -93,7 +130,7 @@ def main() -> None:
     # ------------------------------------------------------------
     print("📄 Copying backend source files...")
 
-    source_files = ["server.py", "lambda_handler.py", "context.py", "resources.py"]
+    source_files = ["server.py", "run.sh", "context.py", "resources.py"]
 
     for file in source_files:
         if os.path.exists(file):
@@ -107,6 +144,17 @@ def main() -> None:
         shutil.copytree("data", "lambda-package/data")
         print("📂 Copied data/ folder")
 
+    # ------------------------------------------------------------
+    # Pre-extract the LinkedIn PDF so Lambda reads plain text
+    # ------------------------------------------------------------
+    if os.path.exists("lambda-package/data/linkedin.pdf"):
+        extract_linkedin_text(
+            "lambda-package/data/linkedin.pdf",
+            "lambda-package/data/linkedin.txt",
+        )
+        os.remove("lambda-package/data/linkedin.pdf")
+        print("📝 Extracted linkedin.pdf to linkedin.txt")
+
     # ------------------------------------------------------------
     # Create the final ZIP file
     # ------------------------------------------------------------
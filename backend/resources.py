@@ -4,14 +4,15 @@ Resource loading utilities for the AI Digital Twin backend.
 This module is responsible for loading and exposing personal data resources
 used to enrich the Digital Twin's behaviour. It reads:
 
-1. A LinkedIn/CV-style PDF (linkedin.pdf) using pypdf
+1. LinkedIn/CV text (linkedin.txt, pre-extracted from linkedin.pdf at build
+   time, with a PyMuPDF fallback when only the PDF is present)
 2. A natural-language professional summary (summary.txt)
 3. A communication style description (style.txt)
 4. Structured factual information (facts.json)
 
 The loaded content is made available as module-level variables:
 
-- linkedin : str  -> extracted text from the LinkedIn PDF (or fallback message)
+- linkedin : str  -> LinkedIn/CV text (or fallback message)
 - summary  : str  -> professional summary text
 - style    : str  -> communication style description
 - facts    : dict -> structured facts about the persona
@@ -24,8 +25,8 @@ in server.py or other backend components.
 # Imports
 # ============================================================
 
-from pypdf import PdfReader
-import json
+import orjson
+import os
 from typing import Any, Dict
 
 
@@ -46,25 +47,63 @@ def _load_linkedin_pdf(path: str = "./data/linkedin.pdf") -> str:
     -------
     str
         The concatenated text extracted from all pages of the PDF.
-        If the file is not found, returns a fallback message.
+        If the file is not found, or PyMuPDF is not installed, returns a
+        fallback message.
     """
+    # Imported lazily: PyMuPDF is only needed when no pre-extracted text exists
     try:
-        # Create a PdfReader instance for the given file path
-        reader: PdfReader = PdfReader(path)
-
-        # Accumulate extracted text from all pages
-        extracted_text: str = ""
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                extracted_text += text
+        import pymupdf
+    except ImportError:
+        print(
+            "PyMuPDF is not installed; cannot extract linkedin.pdf. "
+            "Install it with `pip install -r requirements-dev.txt` (or `uv sync`)."
+        )
+        return "LinkedIn profile not available"
 
-        return extracted_text or "LinkedIn profile could not be extracted"
+    try:
+        # Open the PDF with PyMuPDF (C-backed, much faster than pure-Python parsing)
+        doc = pymupdf.open(path)
 
-    except FileNotFoundError:
+    except (FileNotFoundError, pymupdf.FileNotFoundError):
         # Graceful fallback if the PDF is missing
         return "LinkedIn profile not available"
 
+    try:
+        # Extract and join text from all pages in a single pass
+        return "".join(page.get_text() for page in doc) or "LinkedIn profile could not be extracted"
+
+    finally:
+        doc.close()
+
+
+def _load_linkedin(
+    txt_path: str = "./data/linkedin.txt",
+    pdf_path: str = "./data/linkedin.pdf",
+) -> str:
+    """
+    Load the LinkedIn/CV text, preferring the build-time extracted copy.
+
+    `deploy.py` extracts `linkedin.pdf` to `linkedin.txt` when packaging, so
+    Lambda cold starts read plain text instead of parsing the PDF. Local runs
+    without the text file fall back to PDF extraction.
+
+    Parameters
+    ----------
+    txt_path : str, optional
+        Relative path to the pre-extracted text, by default "./data/linkedin.txt".
+    pdf_path : str, optional
+        Relative path to the source PDF, by default "./data/linkedin.pdf".
+
+    Returns
+    -------
+    str
+        The LinkedIn/CV text, or a fallback message if neither file is usable.
+    """
+    if os.path.exists(txt_path):
+        return _load_text_file(txt_path)
+
+    return _load_linkedin_pdf(pdf_path)
+
 
 def _load_text_file(path: str) -> str:
     """
@@ -98,8 +137,8 @@ def _load_json_file(path: str) -> Dict[str, Any]:
     Dict[str, Any]
         The parsed JSON content.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 # ============================================================
@@ -107,7 +146,7 @@ def _load_json_file(path: str) -> Dict[str, Any]:
 # ============================================================
 
 # Extracted LinkedIn/CV-style information as plain text
-linkedin: str = _load_linkedin_pdf("./data/linkedin.pdf")
+linkedin: str = _load_linkedin("./data/linkedin.txt", "./data/linkedin.pdf")
 
 # Professional summary describing the persona
 summary: str = _load_text_file("./data/summary.txt")
@@ -0,0 +1,14 @@
+#!/bin/bash
+# ============================================================
+# AWS Lambda Web Adapter entrypoint
+# ============================================================
+#
+# Used as the Lambda handler together with the Lambda Web Adapter layer and
+# AWS_LAMBDA_EXEC_WRAPPER=/opt/bootstrap. The adapter forwards incoming
+# events as HTTP requests to the uvicorn server started here. The port follows
+# the adapter's own lookup (AWS_LWA_PORT, then PORT, then 8080), so readiness
+# checks succeed even when neither variable is set.
+
+PATH=$PATH:$LAMBDA_TASK_ROOT/bin \
+PYTHONPATH=$PYTHONPATH:/opt/python:$LAMBDA_RUNTIME_DIR \
+exec python -m uvicorn server:app --host 0.0.0.0 --port "${AWS_LWA_PORT:-${PORT:-8080}}" --workers 1
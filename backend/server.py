@@ -6,18 +6,19 @@ It enables:
 
 1. Health checks
 2. Basic service metadata
-3. Chat interactions using AWS Bedrock models
-4. Persistent conversation memory (local or S3)
+3. Chat interactions using AWS Bedrock models (buffered or streamed over SSE)
+4. Persistent conversation memory (local, S3 or DynamoDB)
 
 Key Features
 ------------
 - Bedrock runtime integration using boto3
 - CORS support for the frontend
 - Session-based conversation history
-- Pluggable memory storage (local JSON or S3)
+- Pluggable memory storage (local JSONL, S3 or DynamoDB)
 - System prompt injection from `context.prompt()`
 
-Each conversation session is tracked by a session_id and stored as structured JSON.
+Each conversation session is tracked by a session_id and stored as append-only
+JSONL (one message per line locally, one small object per turn on S3).
 """
 
 # ============================================================
@@ -27,6 +28,7 @@ Each conversation session is tracked by a session_id and stored as structured JS
 # FastAPI core
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 # Pydantic models
 from pydantic import BaseModel
@@ -36,13 +38,22 @@ from dotenv import load_dotenv
 import os
 
 # Typing + utilities
-from typing import Optional, List, Dict
-import json
+from typing import Optional, List, Dict, Iterator
+import orjson
 import uuid
-from datetime import datetime
-
-# AWS / Bedrock
+import asyncio
+import time
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# AWS / Bedrock (always required: Bedrock is the model backend; S3/DynamoDB
+# clients are only created when their storage backend is enabled)
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # System prompt
@@ -53,8 +64,17 @@ from context import prompt
 # Environment Variables
 # ============================================================
 
-# Load .env variables
-load_dotenv()
+# Load .env variables (local development only; Lambda supplies its own environment)
+if os.getenv("AWS_LAMBDA_FUNCTION_NAME") is None:
+    load_dotenv()
+
+
+# ============================================================
+# System Prompt
+# ============================================================
+
+# Built once at import (Lambda INIT) so each request reuses the same string
+SYSTEM_PROMPT: str = prompt()
 
 
 # ============================================================
@@ -86,15 +106,42 @@ app.add_middleware(
 # AWS Bedrock Client
 # ============================================================
 
-# Initialise Bedrock runtime client
+# Initialise Bedrock runtime client (short connect timeout so an unreachable
+# endpoint fails fast; generous read timeout for long generations)
 bedrock_client = boto3.client(
     service_name="bedrock-runtime",
-    region_name=os.getenv("DEFAULT_AWS_REGION", "us-east-1")
+    region_name=os.getenv("DEFAULT_AWS_REGION", "us-east-1"),
+    config=Config(
+        connect_timeout=2,
+        read_timeout=120,
+        retries={"max_attempts": 2, "mode": "standard"}
+    )
 )
 
+# Warm the Bedrock connection during Lambda INIT (DNS, TLS, credentials) so
+# the first real request in a new container does not pay for it
+if (
+    os.getenv("AWS_LAMBDA_FUNCTION_NAME") is not None
+    and os.getenv("BEDROCK_WARMUP", "true").lower() == "true"
+):
+    try:
+        bedrock_client.list_async_invokes(maxResults=1)
+    except Exception:
+        # Any response (including AccessDenied) still leaves a pooled connection
+        pass
+
 # Select Bedrock model
 BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "amazon.nova-lite-v1:0")
 
+# Toggle Bedrock prompt caching of the static system prompt
+BEDROCK_PROMPT_CACHE = os.getenv("BEDROCK_PROMPT_CACHE", "true").lower() == "true"
+
+# Static system blocks; the cache point marks everything before it as a
+# reusable prefix for Bedrock prompt caching
+SYSTEM_BLOCKS: List[Dict] = [{"text": SYSTEM_PROMPT}]
+if BEDROCK_PROMPT_CACHE:
+    SYSTEM_BLOCKS.append({"cachePoint": {"type": "default"}})
+
 
 # ============================================================
 # Memory Storage Configuration
@@ -106,12 +153,79 @@ USE_S3 = os.getenv("USE_S3", "false").lower() == "true"
 # S3 bucket name
 S3_BUCKET = os.getenv("S3_BUCKET", "")
 
+# Per-turn S3 objects allowed before a session is compacted into one snapshot
+S3_COMPACT_THRESHOLD = max(2, int(os.getenv("S3_COMPACT_THRESHOLD", "20")))
+
+# Key suffix marking an S3 snapshot (the turns merged by one compaction)
+SNAPSHOT_SUFFIX = ".snapshot.json"
+
 # Local directory path
 MEMORY_DIR = os.getenv("MEMORY_DIR", "../memory")
 
+# DynamoDB table name (takes precedence over S3/local storage when set)
+MEMORY_TABLE = os.getenv("MEMORY_TABLE", "")
+USE_DYNAMODB = bool(MEMORY_TABLE)
+
+# Shared client config for memory storage: larger connection pool, bounded retries
+MEMORY_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 2}
+)
+
+# Human-readable name of the active storage backend
+STORAGE_BACKEND = "DynamoDB" if USE_DYNAMODB else "S3" if USE_S3 else "local"
+
+# Create DynamoDB client only if needed (low-level clients are thread-safe,
+# unlike boto3 resources; values are (de)serialised explicitly)
+if USE_DYNAMODB:
+    dynamodb_client = boto3.client(
+        "dynamodb",
+        region_name=os.getenv("DEFAULT_AWS_REGION", "us-east-1"),
+        config=MEMORY_CLIENT_CONFIG
+    )
+    _ddb_serializer = TypeSerializer()
+    _ddb_deserializer = TypeDeserializer()
+
 # Create S3 client only if needed
 if USE_S3:
-    s3_client = boto3.client("s3")
+    s3_client = boto3.client("s3", config=MEMORY_CLIENT_CONFIG)
+    # Shared pool for fetching a session's per-turn objects in parallel
+    _s3_executor = ThreadPoolExecutor(max_workers=16)
+
+
+# ============================================================
+# Response Cache
+# ============================================================
+
+# Maximum number of cached opening-turn responses per container
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))
+
+# In-memory LRU of opening-turn responses, keyed by prompt + message digest
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+
+# ============================================================
+# Session Caches
+# ============================================================
+
+# Number of most recent messages sent to Bedrock as conversation history
+HISTORY_WINDOW = 20
+
+# Maximum number of sessions cached per warm container. Off by default for
+# S3/DynamoDB: other containers can write the same session, and a cached copy
+# would silently drop their turns.
+SESSION_CACHE_SIZE = int(
+    os.getenv("SESSION_CACHE_SIZE", "256" if STORAGE_BACKEND == "local" else "0")
+)
+
+# Full conversation histories already read from storage (LRU by session)
+_session_cache: "OrderedDict[str, List[Dict]]" = OrderedDict()
+
+# Per-session ring buffers of Bedrock-formatted messages (LRU by session)
+_session_windows: "OrderedDict[str, deque]" = OrderedDict()
+
+# Guards both session LRUs; handlers touch them from worker threads
+_session_lock = threading.Lock()
 
 
 # ============================================================
@@ -137,72 +251,393 @@ class Message(BaseModel):
     timestamp: str
 
 
+class ConversationResponse(BaseModel):
+    """Response payload containing the full history for a session."""
+    session_id: str
+    messages: List[Message]
+
+
+class RootResponse(BaseModel):
+    """Response payload for the service metadata endpoint."""
+    message: str
+    memory_enabled: bool
+    storage: str
+    ai_model: str
+
+
+class HealthResponse(BaseModel):
+    """Response payload for the health endpoint."""
+    status: str
+    use_s3: bool
+    bedrock_model: str
+
+
 # ============================================================
 # Memory Management
 # ============================================================
 
 def get_memory_path(session_id: str) -> str:
-    """Return the storage filename/key for a given session."""
+    """Return the local JSONL filename for a given session."""
+    return f"{session_id}.jsonl"
+
+
+def get_memory_prefix(session_id: str) -> str:
+    """Return the S3 key prefix under which a session's turns are stored."""
+    return f"{session_id}/"
+
+
+def get_turn_id() -> str:
+    """Return a new, time-ordered identifier for one turn of a session."""
+    return f"{time.time_ns():020d}"
+
+
+def get_turn_key(session_id: str) -> str:
+    """Return a new, time-ordered S3 key for one turn of a session."""
+    return f"{get_memory_prefix(session_id)}{get_turn_id()}.jsonl"
+
+
+def get_snapshot_key(session_id: str) -> str:
+    """Return a new, unique S3 key for a compacted snapshot of a session."""
+    return f"{get_memory_prefix(session_id)}{get_turn_id()}{SNAPSHOT_SUFFIX}"
+
+
+def get_legacy_turn_key(session_id: str) -> str:
+    """Return the turn key assigned to migrated legacy history (sorts first)."""
+    return f"{get_memory_prefix(session_id)}{0:020d}.jsonl"
+
+
+def is_snapshot_key(key: str) -> bool:
+    """Return True if the S3 key is a compacted snapshot object."""
+    return key.endswith(SNAPSHOT_SUFFIX)
+
+
+def get_legacy_memory_path(session_id: str) -> str:
+    """Return the filename/key used by the older whole-conversation JSON format."""
     return f"{session_id}.json"
 
 
-def load_conversation(session_id: str) -> List[Dict]:
+def _parse_jsonl(data: bytes) -> List[Dict]:
+    """Parse newline-delimited JSON into a list of message dictionaries."""
+    return [orjson.loads(line) for line in data.splitlines() if line]
+
+
+def _dump_jsonl(messages: List[Dict]) -> bytes:
+    """Serialise messages as newline-delimited JSON (one message per line)."""
+    return b"".join(orjson.dumps(msg) + b"\n" for msg in messages)
+
+
+def _put_s3_snapshot(session_id: str, turns: Dict[str, List[Dict]]):
+    """Write a snapshot object mapping each turn key it covers to its messages."""
+    s3_client.put_object(
+        Bucket=S3_BUCKET,
+        Key=get_snapshot_key(session_id),
+        Body=orjson.dumps({"turns": turns}),
+        ContentType="application/json"
+    )
+
+
+def _delete_s3_keys(keys: List[str]):
+    """Best-effort delete of superseded per-turn objects."""
+    try:
+        for i in range(0, len(keys), 1000):
+            s3_client.delete_objects(
+                Bucket=S3_BUCKET,
+                Delete={"Objects": [{"Key": key} for key in keys[i:i + 1000]], "Quiet": True}
+            )
+    except ClientError as e:
+        # Leftover objects are de-duplicated on read, so cleanup can be retried later
+        print(f"S3 memory cleanup error: {str(e)}")
+
+
+def _get_s3_turns(key: str) -> Optional[Dict[str, List[Dict]]]:
     """
-    Load the conversation history for a given session.
+    Fetch one S3 memory object as a mapping of turn key to messages.
+
+    A per-turn object maps to itself; a snapshot maps every turn it covers.
+    Returns None if the object was removed after listing (by a concurrent
+    compaction).
+    """
+    try:
+        body = s3_client.get_object(Bucket=S3_BUCKET, Key=key)["Body"].read()
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            return None
+        raise
+
+    if is_snapshot_key(key):
+        return orjson.loads(body)["turns"]
+    return {key: _parse_jsonl(body)}
+
+
+def _read_s3_conversation(session_id: str) -> List[Dict]:
+    """
+    Read a session's history from its per-turn S3 objects.
+
+    All objects under the session prefix are fetched in parallel and merged
+    by turn key, which sorts chronologically. Snapshots record the turn keys
+    they cover, so overlapping snapshots and turns are de-duplicated rather
+    than relying on key order. When more than S3_COMPACT_THRESHOLD objects
+    are read, they are compacted into a new snapshot and exactly the objects
+    that were read are deleted; turns written concurrently are left alone. A
+    legacy whole-conversation object is migrated into a snapshot the first
+    time the session is read.
+    """
+    # Retry if a concurrent compaction deletes objects between list and get
+    for _ in range(3):
+        keys: List[str] = []
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=S3_BUCKET,
+            Prefix=get_memory_prefix(session_id)
+        ):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+
+        if not keys:
+            return _migrate_legacy_s3_conversation(session_id)
+
+        results = list(_s3_executor.map(_get_s3_turns, keys))
+        if all(result is not None for result in results):
+            break
+    else:
+        raise RuntimeError(f"S3 memory for session {session_id} kept changing while being read")
+
+    turns: Dict[str, List[Dict]] = {}
+    for result in results:
+        turns.update(result)
+    messages = [msg for key in sorted(turns) for msg in turns[key]]
+
+    # Compact long tails into a single snapshot so cold loads stay cheap
+    if len(keys) > S3_COMPACT_THRESHOLD:
+        _put_s3_snapshot(session_id, turns)
+        _delete_s3_keys(keys)
+
+    return messages
+
+
+def _migrate_legacy_s3_conversation(session_id: str) -> List[Dict]:
+    """Carry a legacy whole-conversation object over into a snapshot, if any."""
+    try:
+        response = s3_client.get_object(
+            Bucket=S3_BUCKET,
+            Key=get_legacy_memory_path(session_id)
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            return []
+        raise
+
+    messages = orjson.loads(response["Body"].read())
+    _put_s3_snapshot(session_id, {get_legacy_turn_key(session_id): messages})
+    return messages
+
+
+def _read_conversation(session_id: str) -> List[Dict]:
+    """
+    Read the conversation history for a given session from storage.
+
+    With DynamoDB, each turn is its own item (keyed by session_id and a
+    time-ordered turn_id), fetched with a strongly consistent Query. Locally,
+    messages are read from an append-only JSONL file. On S3, each turn is a
+    small JSONL object under the session prefix; the objects are fetched in
+    parallel and merged in turn (time) order, with periodic compaction into
+    snapshots. Conversations stored in the older single-JSON format are still
+    readable.
 
     Returns a list of message dictionaries, or an empty list
     if no previous conversation exists.
     """
-    if USE_S3:
-        try:
-            # Load from S3
-            response = s3_client.get_object(
-                Bucket=S3_BUCKET,
-                Key=get_memory_path(session_id)
-            )
-            return json.loads(response["Body"].read().decode("utf-8"))
+    if USE_DYNAMODB:
+        messages = []
+        pages = dynamodb_client.get_paginator("query").paginate(
+            TableName=MEMORY_TABLE,
+            KeyConditionExpression="session_id = :sid",
+            ExpressionAttributeValues={":sid": {"S": session_id}},
+            ProjectionExpression="messages",
+            ConsistentRead=True
+        )
+        for page in pages:
+            for item in page["Items"]:
+                messages.extend(_ddb_deserializer.deserialize(item["messages"]))
+        return messages
 
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
-                return []
-            raise
+    if USE_S3:
+        return _read_s3_conversation(session_id)
 
     # Load from local disk
     file_path = os.path.join(MEMORY_DIR, get_memory_path(session_id))
     if os.path.exists(file_path):
-        with open(file_path, "r") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return _parse_jsonl(f.read())
+
+    # Fall back to the legacy whole-conversation file
+    legacy_path = os.path.join(MEMORY_DIR, get_legacy_memory_path(session_id))
+    if os.path.exists(legacy_path):
+        with open(legacy_path, "rb") as f:
+            return orjson.loads(f.read())
 
     return []
 
 
-def save_conversation(session_id: str, messages: List[Dict]):
+def _write_conversation(session_id: str, new_messages: List[Dict]):
     """
-    Save the conversation history for a given session.
+    Append new messages to the stored conversation history for a session.
 
-    Writes to either S3 or local filesystem depending on USE_S3.
+    Only the messages from the current turn are written, so the cost of a
+    save does not grow with the length of the conversation. Writes to
+    DynamoDB (one PutItem per turn) when MEMORY_TABLE is set,
+    otherwise to S3 (one object per turn) or a local JSONL file depending on
+    USE_S3.
     """
-    if USE_S3:
+    if USE_DYNAMODB:
+        dynamodb_client.put_item(
+            TableName=MEMORY_TABLE,
+            Item={
+                "session_id": {"S": session_id},
+                "turn_id": {"S": get_turn_id()},
+                "messages": _ddb_serializer.serialize(new_messages)
+            }
+        )
+    elif USE_S3:
         s3_client.put_object(
             Bucket=S3_BUCKET,
-            Key=get_memory_path(session_id),
-            Body=json.dumps(messages, indent=2),
-            ContentType="application/json"
+            Key=get_turn_key(session_id),
+            Body=_dump_jsonl(new_messages),
+            ContentType="application/x-ndjson"
         )
     else:
         os.makedirs(MEMORY_DIR, exist_ok=True)
         file_path = os.path.join(MEMORY_DIR, get_memory_path(session_id))
-        with open(file_path, "w") as f:
-            json.dump(messages, f, indent=2)
+
+        # Carry over a legacy whole-conversation file before the first append
+        legacy_path = os.path.join(MEMORY_DIR, get_legacy_memory_path(session_id))
+        if not os.path.exists(file_path) and os.path.exists(legacy_path):
+            with open(legacy_path, "rb") as f:
+                new_messages = orjson.loads(f.read()) + new_messages
+
+        with open(file_path, "ab") as f:
+            f.write(_dump_jsonl(new_messages))
+
+
+def load_conversation(session_id: str) -> List[Dict]:
+    """
+    Load the conversation history for a given session.
+
+    Histories are cached per warm container (bounded LRU), so storage is read
+    at most once per session while the container stays warm. The returned
+    list is shared with the cache and must not be mutated by callers.
+    """
+    with _session_lock:
+        messages = _session_cache.get(session_id)
+        if messages is not None:
+            _session_cache.move_to_end(session_id)
+            return messages
+
+    # Storage I/O happens outside the lock
+    messages = _read_conversation(session_id)
+
+    if SESSION_CACHE_SIZE > 0:
+        with _session_lock:
+            # Keep an entry another thread may have cached in the meantime
+            messages = _session_cache.setdefault(session_id, messages)
+            _session_cache.move_to_end(session_id)
+            if len(_session_cache) > SESSION_CACHE_SIZE:
+                _session_cache.popitem(last=False)
+
+    return messages
+
+
+def save_conversation(session_id: str, new_messages: List[Dict]):
+    """
+    Append new messages to the conversation history for a given session.
+
+    Updates the cached history (if present) and then persists the new
+    messages to storage.
+    """
+    with _session_lock:
+        cached = _session_cache.get(session_id)
+        if cached is not None:
+            cached.extend(new_messages)
+
+    _write_conversation(session_id, new_messages)
+
+
+# ============================================================
+# Response Cache Helpers
+# ============================================================
+
+def response_cache_key(user_message: str) -> bytes:
+    """Return the cache key for an opening-turn message."""
+    return hashlib.blake2b(
+        (SYSTEM_PROMPT + "\x00" + user_message).encode("utf-8"),
+        digest_size=16,
+    ).digest()
+
+
+def get_cached_response(key: bytes) -> Optional[str]:
+    """Return a cached response for the key, or None on a miss."""
+    response = _response_cache.get(key)
+    if response is not None:
+        _response_cache.move_to_end(key)
+    return response
+
+
+def cache_response(key: bytes, response: str):
+    """Store a response, evicting the least recently used entry if full."""
+    if RESPONSE_CACHE_SIZE <= 0:
+        return
+    _response_cache[key] = response
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+# ============================================================
+# Conversation Window Helpers
+# ============================================================
+
+def to_bedrock_message(role: str, content: str) -> Dict:
+    """Format a single message in the Bedrock Converse shape."""
+    return {"role": role, "content": [{"text": content}]}
+
+
+def get_session_window(session_id: str) -> deque:
+    """
+    Return the recent-message window for a session.
+
+    Windows are kept in a bounded, container-level LRU so warm invocations
+    reuse already formatted messages. On a miss, the window is hydrated from
+    the stored conversation history.
+    """
+    with _session_lock:
+        window = _session_windows.get(session_id)
+        if window is not None:
+            _session_windows.move_to_end(session_id)
+            return window
+
+    window = deque(
+        (to_bedrock_message(msg["role"], msg["content"])
+         for msg in load_conversation(session_id)[-HISTORY_WINDOW:]),
+        maxlen=HISTORY_WINDOW
+    )
+
+    if SESSION_CACHE_SIZE > 0:
+        with _session_lock:
+            # Keep a window another thread may have cached in the meantime
+            window = _session_windows.setdefault(session_id, window)
+            _session_windows.move_to_end(session_id)
+            if len(_session_windows) > SESSION_CACHE_SIZE:
+                _session_windows.popitem(last=False)
+
+    return window
 
 
 # ============================================================
-# Bedrock Call Function
+# Bedrock Call Functions
 # ============================================================
 
-def call_bedrock(conversation: List[Dict], user_message: str) -> str:
+def build_bedrock_request(window: deque, user_message: str) -> Dict:
     """
-    Send conversation history + current message to AWS Bedrock.
+    Build the Converse request arguments for the window + current message.
 
     Bedrock requires messages formatted as:
     [
@@ -210,77 +645,144 @@ def call_bedrock(conversation: List[Dict], user_message: str) -> str:
         ...
     ]
 
-    Returns the assistant's text response.
+    The static system prompt is sent first via the `system` field, followed
+    by a cache point, so the prefix is identical across requests and eligible
+    for Bedrock prompt caching. Dynamic context (the current date and time)
+    is appended after the cache point.
     """
 
-    # Build messages list
-    messages = []
+    # System prompt: cached static prefix + dynamic suffix
+    system = SYSTEM_BLOCKS + [{
+        "text": f"For reference, here is the current date and time: "
+                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    }]
+
+    # Recent history (already Bedrock-formatted) + current user message
+    with _session_lock:
+        messages = list(window)
+    messages.append(to_bedrock_message("user", user_message))
+
+    return {
+        "modelId": BEDROCK_MODEL_ID,
+        "system": system,
+        "messages": messages,
+        "inferenceConfig": {
+            "maxTokens": 2000,
+            "temperature": 0.7,
+            "topP": 0.9
+        },
+    }
+
+
+def bedrock_http_error(e: ClientError) -> HTTPException:
+    """Map a Bedrock ClientError to the HTTPException returned to the client."""
+    code = e.response["Error"]["Code"]
+
+    if code == "ValidationException":
+        return HTTPException(400, "Invalid message format for Bedrock")
 
-    # Add system prompt (as user-role per Bedrock convention)
-    messages.append({
-        "role": "user",
-        "content": [{"text": f"System: {prompt()}"}]
-    })
+    if code == "AccessDeniedException":
+        return HTTPException(403, "Access denied to Bedrock model")
 
-    # Add last 20 messages from history
-    for msg in conversation[-20:]:
-        messages.append({
-            "role": msg["role"],
-            "content": [{"text": msg["content"]}]
-        })
+    return HTTPException(500, f"Bedrock error: {str(e)}")
 
-    # Add current user message
-    messages.append({
-        "role": "user",
-        "content": [{"text": user_message}]
-    })
 
+def call_bedrock(window: deque, user_message: str) -> str:
+    """
+    Send the recent conversation window + current message to AWS Bedrock.
+
+    Returns the assistant's text response.
+    """
     try:
         # Call Bedrock
         response = bedrock_client.converse(
-            modelId=BEDROCK_MODEL_ID,
-            messages=messages,
-            inferenceConfig={
-                "maxTokens": 2000,
-                "temperature": 0.7,
-                "topP": 0.9
-            }
+            **build_bedrock_request(window, user_message)
         )
 
         # Extract response text
         return response["output"]["message"]["content"][0]["text"]
 
     except ClientError as e:
-        code = e.response["Error"]["Code"]
+        raise bedrock_http_error(e)
+
+
+def stream_bedrock(window: deque, user_message: str) -> Iterator[Dict]:
+    """
+    Start a streaming Bedrock call for the window + current message.
+
+    The request is issued eagerly so that errors surface as HTTPExceptions
+    before the response starts. Returns the iterator of ConverseStream events.
+    """
+    try:
+        response = bedrock_client.converse_stream(
+            **build_bedrock_request(window, user_message)
+        )
+    except ClientError as e:
+        raise bedrock_http_error(e)
 
-        if code == "ValidationException":
-            raise HTTPException(400, "Invalid message format for Bedrock")
+    return response["stream"]
 
-        if code == "AccessDeniedException":
-            raise HTTPException(403, "Access denied to Bedrock model")
 
-        raise HTTPException(500, f"Bedrock error: {str(e)}")
+# Stop reasons for which a (possibly partial) reply must not be stored
+BLOCKED_STOP_REASONS = {"guardrail_intervened", "content_filtered"}
+
+
+# ============================================================
+# Turn Recording
+# ============================================================
+
+def record_turn(session_id: str, window: deque, user_message: str, assistant_response: str):
+    """Append a completed user/assistant turn to memory and the session window."""
+    # One UTC timestamp for the whole turn
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    new_messages = [
+        {
+            "role": "user",
+            "content": user_message,
+            "timestamp": now_iso,
+        },
+        {
+            "role": "assistant",
+            "content": assistant_response,
+            "timestamp": now_iso,
+        },
+    ]
+
+    save_conversation(session_id, new_messages)
+
+    # Add both messages in one step so concurrent readers never see half a turn
+    with _session_lock:
+        window.extend((
+            to_bedrock_message("user", user_message),
+            to_bedrock_message("assistant", assistant_response),
+        ))
 
 
 # ============================================================
 # API Routes
 # ============================================================
 
-@app.get("/")
+# Static status payloads, built once (config does not change at runtime)
+_ROOT_RESP = RootResponse(
+    message="AI Digital Twin API (Powered by AWS Bedrock)",
+    memory_enabled=True,
+    storage=STORAGE_BACKEND,
+    ai_model=BEDROCK_MODEL_ID
+)
+_HEALTH_RESP = HealthResponse(status="healthy", use_s3=USE_S3, bedrock_model=BEDROCK_MODEL_ID)
+
+
+@app.get("/", response_model=RootResponse)
 async def root():
     """Basic status endpoint for initial service verification."""
-    return {
-        "message": "AI Digital Twin API (Powered by AWS Bedrock)",
-        "memory_enabled": True,
-        "storage": "S3" if USE_S3 else "local",
-        "ai_model": BEDROCK_MODEL_ID
-    }
+    return _ROOT_RESP
 
 
-@app.get("/health")
+@app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health endpoint for monitoring."""
-    return {"status": "healthy", "use_s3": USE_S3, "bedrock_model": BEDROCK_MODEL_ID}
+    return _HEALTH_RESP
 
 
 @app.post("/chat", response_model=ChatResponse)
@@ -290,36 +792,38 @@ async def chat(request: ChatRequest):
 
     Steps:
     1. Create or reuse session_id
-    2. Load conversation history
-    3. Call AWS Bedrock with context
-    4. Append new messages
-    5. Save updated memory
+    2. Load the recent conversation window
+    3. Call AWS Bedrock with context (or reuse a cached opening-turn reply)
+    4. Append the new user/assistant messages to memory
+
+    Only opening turns (empty history) are served from the response cache,
+    since their reply depends solely on the system prompt and the message.
+
+    Storage and Bedrock calls use synchronous boto3 clients, so they run in
+    worker threads to keep the event loop free for concurrent requests.
     """
     try:
         session_id = request.session_id or str(uuid.uuid4())
 
-        # Load history
-        conversation = load_conversation(session_id)
+        # Load recent history (blocking storage I/O runs off the event loop)
+        window = await asyncio.to_thread(get_session_window, session_id)
 
-        # Query Bedrock
-        assistant_response = call_bedrock(conversation, request.message)
+        # Opening turns are stateless, so repeated messages can be cached
+        cache_key = None if window else response_cache_key(request.message)
+        assistant_response = get_cached_response(cache_key) if cache_key else None
 
-        # Append user message
-        conversation.append({
-            "role": "user",
-            "content": request.message,
-            "timestamp": datetime.now().isoformat(),
-        })
-
-        # Append assistant message
-        conversation.append({
-            "role": "assistant",
-            "content": assistant_response,
-            "timestamp": datetime.now().isoformat(),
-        })
+        # Query Bedrock on a cache miss
+        if assistant_response is None:
+            assistant_response = await asyncio.to_thread(
+                call_bedrock, window, request.message
+            )
+            if cache_key:
+                cache_response(cache_key, assistant_response)
 
-        # Save
-        save_conversation(session_id, conversation)
+        # Append this turn to memory and the in-process window
+        await asyncio.to_thread(
+            record_turn, session_id, window, request.message, assistant_response
+        )
 
         return ChatResponse(response=assistant_response, session_id=session_id)
 
@@ -331,11 +835,77 @@ async def chat(request: ChatRequest):
         raise HTTPException(500, str(e))
 
 
-@app.get("/conversation/{session_id}")
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint using Server-Sent Events.
+
+    Emits one `data:` event per text delta as Bedrock generates it, followed
+    by a final event carrying the session_id. The completed turn is saved to
+    memory once the stream has finished; blank replies and replies stopped by
+    a guardrail or content filter end with an error event and are not saved.
+    The synchronous event generator is iterated in Starlette's threadpool, so
+    it does not block the event loop.
+
+    True streaming requires a transport that supports it (uvicorn locally, or
+    a Lambda Function URL with RESPONSE_STREAM invoke mode); API Gateway REST
+    buffers the whole response.
+    """
+    try:
+        session_id = request.session_id or str(uuid.uuid4())
+
+        # Load recent history and start the Bedrock stream off the event loop
+        window = await asyncio.to_thread(get_session_window, session_id)
+        events = await asyncio.to_thread(stream_bedrock, window, request.message)
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        print(f"Chat stream endpoint error: {str(e)}")
+        raise HTTPException(500, str(e))
+
+    def event_stream() -> Iterator[str]:
+        parts: List[str] = []
+        stop_reason: Optional[str] = None
+        try:
+            for event in events:
+                if "messageStop" in event:
+                    stop_reason = event["messageStop"].get("stopReason")
+                    continue
+
+                delta = event.get("contentBlockDelta", {}).get("delta", {}).get("text")
+                if delta:
+                    parts.append(delta)
+                    yield f"data: {orjson.dumps({'delta': delta}).decode()}\n\n"
+
+            # Never store a blank or blocked reply: an empty text block would
+            # make every later Bedrock call for this session fail validation
+            assistant_response = "".join(parts)
+            if not assistant_response.strip() or stop_reason in BLOCKED_STOP_REASONS:
+                error = {
+                    "error": f"No response generated (stop reason: {stop_reason})",
+                    "session_id": session_id
+                }
+                yield f"data: {orjson.dumps(error).decode()}\n\n"
+                return
+
+            # Save the completed turn after the stream closes
+            record_turn(session_id, window, request.message, assistant_response)
+            yield f"data: {orjson.dumps({'done': True, 'session_id': session_id}).decode()}\n\n"
+
+        except Exception as e:
+            print(f"Chat stream error: {str(e)}")
+            yield f"data: {orjson.dumps({'error': str(e)}).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.get("/conversation/{session_id}", response_model=ConversationResponse)
 async def get_conversation(session_id: str):
     """Retrieve the full conversation history for a given session."""
     try:
-        history = load_conversation(session_id)
+        history = await asyncio.to_thread(load_conversation, session_id)
         return {"session_id": session_id, "messages": history}
     except Exception as e:
         raise HTTPException(500, str(e))